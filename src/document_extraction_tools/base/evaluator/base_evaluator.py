@@ -6,7 +6,7 @@ predicted data against ground-truth data.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic
+from typing import ClassVar, Generic
 
 from document_extraction_tools.config.base_evaluator_config import BaseEvaluatorConfig
 from document_extraction_tools.config.evaluation_pipeline_config import (
@@ -24,11 +24,14 @@ class BaseEvaluator(ABC, Generic[ExtractionSchema]):
     """Abstract interface for evaluation metrics.
 
     Attributes:
+        config_cls (type[BaseEvaluatorConfig] | None): Config class to select from the
+            pipeline config. When unset, the config named ``<EvaluatorName>Config`` is used.
         config (BaseEvaluatorConfig): Component-specific configuration.
         pipeline_config (EvaluationPipelineConfig | None): Optional pipeline configuration
             when constructed with a pipeline config.
     """
 
+    config_cls: ClassVar[type[BaseEvaluatorConfig] | None] = None
     config: BaseEvaluatorConfig
     pipeline_config: EvaluationPipelineConfig | None
 
@@ -58,11 +61,16 @@ class BaseEvaluator(ABC, Generic[ExtractionSchema]):
             BaseEvaluatorConfig: The config matching this evaluator.
         """
         evaluator_key = self.__class__.__name__
-        config_lookup = {
-            item.__class__.__name__.replace("Config", ""): item
-            for item in pipeline_config.evaluators
-        }
-        evaluator_config = config_lookup.get(evaluator_key)
+        evaluator_config: BaseEvaluatorConfig | None
+        if self.config_cls is not None:
+            config_by_type = {type(item): item for item in pipeline_config.evaluators}
+            evaluator_config = config_by_type.get(self.config_cls)
+        else:
+            config_lookup = {
+                item.__class__.__name__.replace("Config", ""): item
+                for item in pipeline_config.evaluators
+            }
+            evaluator_config = config_lookup.get(evaluator_key)
         if evaluator_config is None:
             raise ValueError(f"No configuration found for evaluator '{evaluator_key}'.")
         return evaluator_config
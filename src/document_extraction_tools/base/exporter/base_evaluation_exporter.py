@@ -56,6 +56,9 @@ class BaseEvaluationExporter(ABC):
         """Persist evaluation results to a target destination.
 
         This is an asynchronous operation to support non-blocking I/O writes.
+        By default the orchestrator calls it once per run with every result, in
+        the order the examples were given; when export_batch_size is configured
+        it is called once per batch instead, with results in completion order.
 
         Args:
             results (list[tuple[Document, list[EvaluationResult]]]):
@@ -70,3 +70,29 @@ class BaseExtractionExporter(ABC):
             None: The method should raise an exception if the export fails.
         """
         pass
+
+    async def export_batch(
+        self,
+        results: list[tuple[Document, ExtractionResult[ExtractionSchema]]],
+        context: PipelineContext | None = None,
+    ) -> None:
+        """Persists the results for a batch of documents.
+
+        Override it to write the whole batch in one operation (e.g. a single
+        database transaction). The extraction orchestrator calls an override
+        when ``extraction_batch_size`` is set, and logs every document in the
+        batch as failed if it raises, so overrides should be all-or-nothing.
+        Without an override, the orchestrator exports each result with
+        ``export()`` and handles failures per document. The default here
+        exports each result in turn.
+
+        Args:
+            results (list[tuple[Document, ExtractionResult[ExtractionSchema]]]):
+                The source documents paired with their extracted data.
+            context (PipelineContext | None): Optional shared pipeline context.
+
+        Returns:
+            None: The method should raise an exception if the export fails.
+        """
+        for document, data in results:
+            await self.export(document, data, context)
@@ -5,7 +5,13 @@ Extractors are responsible for analyzing the structured Document
 and populating a target Pydantic schema with specific data points.
 """
 
+import asyncio
+import copy
 from abc import ABC, abstractmethod
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
 
 from document_extraction_tools.config.base_extractor_config import BaseExtractorConfig
 from document_extraction_tools.config.evaluation_pipeline_config import (
@@ -21,6 +27,19 @@ from document_extraction_tools.types.extraction_result import (
     ExtractionSchema,
 )
 
+# Weak keys let schema classes created at runtime be garbage collected.
+_json_schema_cache: WeakKeyDictionary[type[BaseModel], dict[str, Any]] = (
+    WeakKeyDictionary()
+)
+
+
+def _cached_json_schema(schema: type[BaseModel]) -> dict[str, Any]:
+    """Generate a schema's JSON schema once per schema class."""
+    cached = _json_schema_cache.get(schema)
+    if cached is None:
+        cached = _json_schema_cache[schema] = schema.model_json_schema()
+    return cached
+
 
 class BaseExtractor(ABC):
     """Abstract interface for data extraction.
@@ -53,6 +72,22 @@ class BaseExtractor(ABC):
             self.pipeline_config = None
             self.config = config
 
+    @staticmethod
+    def json_schema(schema: type[ExtractionSchema]) -> dict[str, Any]:
+        """Returns the JSON schema of the extraction schema.
+
+        Pydantic rebuilds the JSON schema on every ``model_json_schema()`` call;
+        this generates it once per schema class and returns a copy, so prompts
+        built for every document do not pay for it repeatedly.
+
+        Args:
+            schema (type[ExtractionSchema]): The Pydantic model class defining the target structure.
+
+        Returns:
+            dict[str, Any]: The JSON schema of ``schema``.
+        """
+        return copy.deepcopy(_cached_json_schema(schema))
+
     @abstractmethod
     async def extract(
         self,
@@ -73,3 +108,33 @@ class BaseExtractor(ABC):
             ExtractionResult[ExtractionSchema]: The extracted data with metadata.
         """
         pass
+
+    async def extract_batch(
+        self,
+        documents: list[Document],
+        schema: type[ExtractionSchema],
+        context: PipelineContext | None = None,
+    ) -> list[ExtractionResult[ExtractionSchema]]:
+        """Extracts structured data from several documents.
+
+        Override it to send the whole batch to the provider in a single request.
+        The extraction orchestrator calls an override when
+        ``extraction_batch_size`` is set, and logs every document in the batch
+        as failed if it raises. Without an override, the orchestrator calls
+        ``extract`` per document instead. The default here runs ``extract`` for
+        each document concurrently and cancels the rest if one fails.
+
+        Args:
+            documents (list[Document]): The fully parsed documents.
+            schema (type[ExtractionSchema]): The Pydantic model class defining the target structure.
+            context (PipelineContext | None): Optional shared pipeline context.
+
+        Returns:
+            list[ExtractionResult[ExtractionSchema]]: One result per document, in order.
+        """
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(self.extract(document, schema, context))
+                for document in documents
+            ]
+        return [task.result() for task in tasks]
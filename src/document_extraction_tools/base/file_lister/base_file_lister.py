@@ -5,7 +5,9 @@ File Listers are responsible for scanning a source
 and returning a list of standardized identifiers to be processed.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from document_extraction_tools.config.base_file_lister_config import (
     BaseFileListerConfig,
@@ -62,3 +64,22 @@ class BaseFileLister(ABC):
                                   path and any necessary execution context.
         """
         pass
+
+    async def iter_files(
+        self, context: PipelineContext | None = None
+    ) -> AsyncIterator[PathIdentifier]:
+        """Yields file identifiers as they are discovered.
+
+        The default implementation runs list_files in a worker thread and yields
+        its results. Override this to stream identifiers from large sources so
+        the orchestrator can start processing before the scan has finished.
+
+        Args:
+            context (PipelineContext | None): Optional shared pipeline context.
+
+        Yields:
+            PathIdentifier: Standardized objects containing the path and any
+                            necessary execution context.
+        """
+        for path_identifier in await asyncio.to_thread(self.list_files, context):
+            yield path_identifier
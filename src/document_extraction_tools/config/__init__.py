@@ -17,6 +17,7 @@ from document_extraction_tools.config.base_test_data_loader_config import (
     BaseTestDataLoaderConfig,
 )
 from document_extraction_tools.config.config_loader import (
+    clear_config_cache,
     load_evaluation_config,
     load_extraction_config,
 )
@@ -48,4 +49,5 @@ __all__ = [
     "ExtractionPipelineConfig",
     "load_extraction_config",
     "load_evaluation_config",
+    "clear_config_cache",
 ]
@@ -2,7 +2,7 @@
 
 from typing import ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BaseEvaluationExporterConfig(BaseModel):
@@ -11,4 +11,6 @@ class BaseEvaluationExporterConfig(BaseModel):
     Implementations should subclass this to add specific parameters.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     filename: ClassVar[str] = "evaluation_exporter.yaml"
@@ -1,5 +1,7 @@
 """Configuration Loader."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -35,9 +37,42 @@ from document_extraction_tools.config.extraction_pipeline_config import (
 )
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a YAML file, memoized on its path and stat signature.
+
+    The modification time and size are only used as cache keys so that an
+    edited file is parsed again on the next load.
+
+    Args:
+        path (Path): Resolved path to the .yaml file.
+        mtime_ns (int): File modification time in nanoseconds.
+        size (int): File size in bytes.
+
+    Returns:
+        dict[str, Any]: The parsed YAML data, or an empty dict if the file is empty.
+    """
+    with open(path) as f:
+        return yaml.safe_load(f) or {}
+
+
+def clear_config_cache() -> None:
+    """Forget every parsed YAML file so the next load reads from disk.
+
+    The loaders detect edits through a file's modification time and size, so an
+    edit that keeps both, such as a same-length change within the filesystem's
+    timestamp resolution, is not seen until the cache is cleared.
+    """
+    _parse_yaml.cache_clear()
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
     """Helper to load a YAML file into a dictionary.
 
+    Repeated loads of an unchanged file in the same process reuse the parsed
+    result instead of reading and parsing the file again. Call
+    clear_config_cache() to force a fresh read.
+
     Args:
         path (Path): Path to the .yaml file.
 
@@ -51,8 +86,9 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path.absolute()}")
 
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    stat = path.stat()
+    # Deep copy so callers cannot mutate the cached parse result.
+    return copy.deepcopy(_parse_yaml(path.resolve(), stat.st_mtime_ns, stat.st_size))
 
 
 def load_extraction_config(
@@ -1,13 +1,15 @@
 """Configuration for the Evaluation Orchestrator component."""
 
-from typing import ClassVar
+from typing import ClassVar, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EvaluationOrchestratorConfig(BaseModel):
     """Configuration for the Evaluation Orchestrator."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     filename: ClassVar[str] = "evaluation_orchestrator.yaml"
 
     max_workers: int = Field(
@@ -17,5 +19,53 @@ class EvaluationOrchestratorConfig(BaseModel):
 
     max_concurrency: int = Field(
         default=10,
-        description="Maximum number of concurrent I/O requests allowed.",
+        description=(
+            "Number of examples in flight at once, which also bounds concurrent "
+            "extractor calls."
+        ),
+    )
+
+    executor_type: Literal["thread", "process"] = Field(
+        default="thread",
+        description=(
+            "Executor for CPU-bound tasks: threads or processes. Process workers "
+            "require picklable components and context."
+        ),
+    )
+
+    max_tasks_per_child: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Replace each worker process after this many tasks to cap memory growth "
+            "in long runs. Only applies when executor_type is 'process'."
+        ),
+    )
+
+    io_max_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Run reader I/O on a separate thread pool of this size, leaving the "
+            "max_workers pool for conversion. By default each document is read and "
+            "converted in a single task on the max_workers pool."
+        ),
+    )
+
+    parallel_evaluators: bool = Field(
+        default=False,
+        description=(
+            "Submit each evaluator to the pool separately so an example's evaluators "
+            "run concurrently. Useful when evaluators block on I/O (e.g. LLM judges); "
+            "by default all evaluators for an example run in one submission."
+        ),
+    )
+
+    export_batch_size: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Export results in batches of this many examples as they complete. "
+            "By default all results are exported in a single call after the run."
+        ),
     )
@@ -1,6 +1,6 @@
 """Master Evaluation Pipeline Configuration."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from document_extraction_tools.config.base_converter_config import BaseConverterConfig
 from document_extraction_tools.config.base_evaluation_exporter_config import (
@@ -23,6 +23,8 @@ class EvaluationPipelineConfig(BaseModel):
     This class aggregates the configurations for all evaluation pipeline components.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     evaluation_orchestrator: EvaluationOrchestratorConfig = Field(
         ..., description="Configuration for orchestrating evaluation execution."
     )
@@ -1,13 +1,15 @@
 """Configuration for the Extraction Orchestrator component."""
 
-from typing import ClassVar
+from typing import ClassVar, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExtractionOrchestratorConfig(BaseModel):
     """Configuration for the Pipeline Orchestrator."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     filename: ClassVar[str] = "extraction_orchestrator.yaml"
 
     max_workers: int = Field(
@@ -19,3 +21,47 @@ class ExtractionOrchestratorConfig(BaseModel):
         default=10,
         description="Maximum number of concurrent I/O requests allowed.",
     )
+
+    executor_type: Literal["thread", "process"] = Field(
+        default="thread",
+        description=(
+            "Executor for CPU-bound tasks: threads or processes. Process workers "
+            "require picklable components and context."
+        ),
+    )
+
+    max_tasks_per_child: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Replace each worker process after this many tasks to cap memory growth "
+            "in long runs. Only applies when executor_type is 'process'."
+        ),
+    )
+
+    io_max_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Run reader I/O on a separate thread pool of this size, leaving the "
+            "max_workers pool for conversion. By default each document is read and "
+            "converted in a single task on the max_workers pool."
+        ),
+    )
+
+    extraction_batch_size: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Hand documents to the extractor's extract_batch() in batches of up to "
+            "this many. By default each document is extracted on its own."
+        ),
+    )
+
+    extraction_batch_delay: float = Field(
+        default=0.05,
+        ge=0,
+        description=(
+            "Seconds to wait for a batch to fill before extracting a partial batch."
+        ),
+    )
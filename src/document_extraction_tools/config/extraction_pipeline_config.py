@@ -1,6 +1,6 @@
 """Master Extraction Pipeline Configuration."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from document_extraction_tools.config.base_converter_config import BaseConverterConfig
 from document_extraction_tools.config.base_extraction_exporter_config import (
@@ -22,6 +22,8 @@ class ExtractionPipelineConfig(BaseModel):
     This class aggregates the configurations for all pipeline components.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     extraction_orchestrator: ExtractionOrchestratorConfig = Field(
         ..., description="Configuration for orchestrating extraction execution."
     )
@@ -0,0 +1,298 @@
+"""Shared orchestrator machinery.
+
+This module contains the executor lifecycle and ingestion helpers used by both
+the extraction and evaluation orchestrators, so that changes to how CPU-bound
+work is scheduled apply to every pipeline.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import TracebackType
+from typing import Any, ClassVar, Self, TypeVar
+
+from document_extraction_tools.base.converter.base_converter import BaseConverter
+from document_extraction_tools.base.reader.base_reader import BaseReader
+from document_extraction_tools.config.evaluation_orchestrator_config import (
+    EvaluationOrchestratorConfig,
+)
+from document_extraction_tools.config.extraction_orchestrator_config import (
+    ExtractionOrchestratorConfig,
+)
+from document_extraction_tools.runners.executor import (
+    create_executor,
+    get_worker_component,
+)
+from document_extraction_tools.types.context import PipelineContext
+from document_extraction_tools.types.document import Document
+from document_extraction_tools.types.document_bytes import DocumentBytes
+from document_extraction_tools.types.path_identifier import PathIdentifier
+
+T = TypeVar("T")
+
+
+class BaseOrchestrator:
+    """Executor lifecycle and ingestion shared by the orchestrators.
+
+    Subclasses set the attributes below in their own ``__init__``.
+
+    Attributes:
+        config (ExtractionOrchestratorConfig | EvaluationOrchestratorConfig):
+            Orchestrator configuration.
+        reader (BaseReader): Reader component instance.
+        converter (BaseConverter): Converter component instance.
+    """
+
+    thread_name_prefix: ClassVar[str] = "orchestrator"
+
+    config: ExtractionOrchestratorConfig | EvaluationOrchestratorConfig
+    reader: BaseReader
+    converter: BaseConverter
+    _pool: Executor | None = None
+    _io_pool: Executor | None = None
+
+    def _worker_components(self) -> dict[str, Any]:
+        """Returns the components to install in process workers.
+
+        Returns:
+            dict[str, Any]: The components, keyed by name.
+        """
+        return {"reader": self.reader, "converter": self.converter}
+
+    def _get_pool(self) -> Executor:
+        """Returns the orchestrator's executor, creating it on first use.
+
+        The pool is kept across run() calls and released by aclose().
+
+        Returns:
+            Executor: The shared pool for CPU-bound tasks.
+        """
+        if self._pool is None:
+            self._pool = create_executor(
+                self.config.executor_type,
+                max_workers=self.config.max_workers,
+                thread_name_prefix=self.thread_name_prefix,
+                components=self._worker_components(),
+                max_tasks_per_child=self.config.max_tasks_per_child,
+            )
+        return self._pool
+
+    def _get_io_pool(self) -> Executor | None:
+        """Returns the reader thread pool, creating it on first use.
+
+        Returns:
+            Executor | None: The pool for reader I/O, or None if
+                ``io_max_workers`` is not set.
+        """
+        if self._io_pool is None and self.config.io_max_workers is not None:
+            self._io_pool = create_executor(
+                "thread",
+                max_workers=self.config.io_max_workers,
+                thread_name_prefix=f"{self.thread_name_prefix}-io",
+                components={},
+            )
+        return self._io_pool
+
+    def _uses_worker_components(self, pool: Executor) -> bool:
+        """Whether tasks on the pool must use the components installed in it.
+
+        Only process pools created by _get_pool() have the components
+        installed. Thread pools share the orchestrator's components, and any
+        other pool is sent them with each submission.
+
+        Args:
+            pool (Executor): The executor the task will run on.
+
+        Returns:
+            bool: True if the pool is this orchestrator's own process pool.
+        """
+        return pool is self._pool and not isinstance(pool, ThreadPoolExecutor)
+
+    async def _run_on_pool(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        pool: Executor,
+        func: Callable[..., T],
+        *args: object,
+    ) -> T:
+        """Runs a function on the pool, replacing the pool if a worker died.
+
+        When a worker process dies, every later submission to its pool fails
+        with BrokenProcessPool. If the broken pool is this orchestrator's own,
+        it is shut down and dropped so the next _get_pool() call creates a new
+        one.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop to use.
+            pool (Executor): The executor to run the function in.
+            func (Callable[..., T]): The function to execute.
+            *args (object): Arguments to pass to the function.
+
+        Returns:
+            T: The result of the function execution.
+        """
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            if pool is self._pool:
+                self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    async def aclose(self) -> None:
+        """Shut down the executors, waiting for queued work to finish."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, wait=True)
+        if self._io_pool is not None:
+            io_pool, self._io_pool = self._io_pool, None
+            await asyncio.to_thread(io_pool.shutdown, wait=True)
+
+    async def __aenter__(self) -> Self:
+        """Start the executor for use by every run() in this scope.
+
+        Returns:
+            Self: The orchestrator itself.
+        """
+        self._get_pool()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut down the executor.
+
+        Args:
+            exc_type (type[BaseException] | None): Exception type, if raised.
+            exc (BaseException | None): Exception instance, if raised.
+            traceback (TracebackType | None): Exception traceback, if raised.
+        """
+        await self.aclose()
+
+    @staticmethod
+    def _ingest(
+        path_identifier: PathIdentifier,
+        reader: BaseReader,
+        converter: BaseConverter,
+        context: PipelineContext,
+    ) -> Document:
+        """Performs the CPU-bound ingestion phase.
+
+        Args:
+            path_identifier (PathIdentifier): The path identifier to the source file.
+            reader (BaseReader): The reader instance to use.
+            converter (BaseConverter): The converter instance to use.
+            context (PipelineContext): Shared pipeline context.
+
+        Returns:
+            Document: The fully parsed document object.
+        """
+        doc_bytes: DocumentBytes = reader.read(path_identifier, context)
+        return converter.convert(doc_bytes, context)
+
+    @staticmethod
+    def _ingest_in_worker(
+        path_identifier: PathIdentifier, context: PipelineContext
+    ) -> Document:
+        """Runs the ingestion phase with the components installed in a worker.
+
+        Args:
+            path_identifier (PathIdentifier): The path identifier to the source file.
+            context (PipelineContext): Shared pipeline context.
+
+        Returns:
+            Document: The fully parsed document object.
+        """
+        return BaseOrchestrator._ingest(
+            path_identifier,
+            get_worker_component("reader"),
+            get_worker_component("converter"),
+            context,
+        )
+
+    @staticmethod
+    def _convert_in_worker(
+        document_bytes: DocumentBytes, context: PipelineContext
+    ) -> Document:
+        """Runs the conversion phase with the converter installed in a worker.
+
+        Args:
+            document_bytes (DocumentBytes): The raw bytes read from the source file.
+            context (PipelineContext): Shared pipeline context.
+
+        Returns:
+            Document: The fully parsed document object.
+        """
+        converter: BaseConverter = get_worker_component("converter")
+        return converter.convert(document_bytes, context)
+
+    async def _ingest_on_pool(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        pool: Executor,
+        path_identifier: PathIdentifier,
+        context: PipelineContext,
+    ) -> Document:
+        """Submits the ingestion phase for one document to the pool.
+
+        When ``io_max_workers`` is set, the read runs on the reader thread pool
+        and only the conversion is submitted to ``pool``.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop to use.
+            pool (Executor): The shared pool for CPU tasks.
+            path_identifier (PathIdentifier): The path identifier to the source file.
+            context (PipelineContext): Shared pipeline context.
+
+        Returns:
+            Document: The fully parsed document object.
+        """
+        io_pool = self._get_io_pool()
+        if io_pool is not None:
+            document_bytes = await loop.run_in_executor(
+                io_pool, self.reader.read, path_identifier, context
+            )
+            if self._uses_worker_components(pool):
+                return await self._run_on_pool(
+                    loop, pool, self._convert_in_worker, document_bytes, context
+                )
+            return await self._run_on_pool(
+                loop, pool, self.converter.convert, document_bytes, context
+            )
+
+        if self._uses_worker_components(pool):
+            return await self._run_on_pool(
+                loop, pool, self._ingest_in_worker, path_identifier, context
+            )
+        return await self._run_on_pool(
+            loop,
+            pool,
+            self._ingest,
+            path_identifier,
+            self.reader,
+            self.converter,
+            context,
+        )
+
+    @staticmethod
+    async def _iter_items(
+        items: Iterable[T] | AsyncIterable[T],
+    ) -> AsyncIterator[T]:
+        """Iterate over a synchronous or asynchronous source of items.
+
+        Args:
+            items (Iterable[T] | AsyncIterable[T]): The items to iterate over.
+
+        Yields:
+            T: Each item in the order produced by the source.
+        """
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                yield item
+        else:
+            for item in items:
+                yield item
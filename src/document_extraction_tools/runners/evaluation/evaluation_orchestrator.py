@@ -7,11 +7,11 @@ running extraction, applying evaluators, and exporting results.
 """
 
 import asyncio
-import contextvars
+import contextlib
 import logging
-from collections.abc import Callable, Iterable
-from concurrent.futures import ThreadPoolExecutor
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterable, Iterable
+from concurrent.futures import Executor
+from typing import Any, Generic
 
 from document_extraction_tools.base.converter.base_converter import BaseConverter
 from document_extraction_tools.base.evaluator.base_evaluator import BaseEvaluator
@@ -29,22 +29,21 @@ from document_extraction_tools.config.evaluation_orchestrator_config import (
 from document_extraction_tools.config.evaluation_pipeline_config import (
     EvaluationPipelineConfig,
 )
+from document_extraction_tools.runners.base_orchestrator import BaseOrchestrator
+from document_extraction_tools.runners.executor import get_worker_component
 from document_extraction_tools.types.context import PipelineContext
 from document_extraction_tools.types.document import Document
-from document_extraction_tools.types.document_bytes import DocumentBytes
 from document_extraction_tools.types.evaluation_example import EvaluationExample
 from document_extraction_tools.types.evaluation_result import EvaluationResult
 from document_extraction_tools.types.extraction_result import (
     ExtractionResult,
     ExtractionSchema,
 )
-from document_extraction_tools.types.path_identifier import PathIdentifier
 
 logger = logging.getLogger(__name__)
-T = TypeVar("T")
 
 
-class EvaluationOrchestrator(Generic[ExtractionSchema]):
+class EvaluationOrchestrator(BaseOrchestrator, Generic[ExtractionSchema]):
     """Coordinates evaluation across multiple evaluators.
 
     Attributes:
@@ -58,6 +57,10 @@ class EvaluationOrchestrator(Generic[ExtractionSchema]):
         schema (type[ExtractionSchema]): Target extraction schema.
     """
 
+    thread_name_prefix = "evaluation-orchestrator"
+
+    config: EvaluationOrchestratorConfig
+
     def __init__(
         self,
         config: EvaluationOrchestratorConfig,
@@ -89,6 +92,15 @@ class EvaluationOrchestrator(Generic[ExtractionSchema]):
         self.evaluators = list(evaluators)
         self.evaluation_exporter = evaluation_exporter
         self.schema = schema
+        self._pool = None
+
+    def _worker_components(self) -> dict[str, Any]:
+        """Returns the components to install in process workers.
+
+        Returns:
+            dict[str, Any]: The reader, converter and evaluators, keyed by name.
+        """
+        return {**super()._worker_components(), "evaluators": self.evaluators}
 
     @classmethod
     def from_config(
@@ -142,60 +154,114 @@ class EvaluationOrchestrator(Generic[ExtractionSchema]):
         )
 
     @staticmethod
-    def _ingest(
-        path_identifier: PathIdentifier,
-        reader: BaseReader,
-        converter: BaseConverter,
+    def _evaluate_all(
+        evaluators: list[BaseEvaluator[ExtractionSchema]],
+        true: ExtractionResult[ExtractionSchema],
+        pred: ExtractionResult[ExtractionSchema],
         context: PipelineContext,
-    ) -> Document:
-        """Performs the CPU-bound ingestion phase.
+    ) -> list[EvaluationResult]:
+        """Runs every evaluator for one example in a single worker call.
 
         Args:
-            path_identifier (PathIdentifier): The path identifier to the source file.
-            reader (BaseReader): The reader instance to use.
-            converter (BaseConverter): The converter instance to use.
+            evaluators (list[BaseEvaluator[ExtractionSchema]]): The evaluators to apply.
+            true (ExtractionResult[ExtractionSchema]): Ground-truth data with metadata.
+            pred (ExtractionResult[ExtractionSchema]): Predicted data with metadata.
             context (PipelineContext): Shared pipeline context.
 
         Returns:
-            Document: The fully parsed document object.
+            list[EvaluationResult]: One result per evaluator, in evaluator order.
         """
-        doc_bytes: DocumentBytes = reader.read(path_identifier, context)
-        return converter.convert(doc_bytes, context)
+        return [evaluator.evaluate(true, pred, context) for evaluator in evaluators]
 
     @staticmethod
-    async def _run_in_executor_with_context(
+    def _evaluate_all_in_worker(
+        true: ExtractionResult[ExtractionSchema],
+        pred: ExtractionResult[ExtractionSchema],
+        context: PipelineContext,
+        index: int | None = None,
+    ) -> list[EvaluationResult]:
+        """Runs the evaluators installed in a worker for one example.
+
+        Args:
+            true (ExtractionResult[ExtractionSchema]): Ground-truth data with metadata.
+            pred (ExtractionResult[ExtractionSchema]): Predicted data with metadata.
+            context (PipelineContext): Shared pipeline context.
+            index (int | None): Run only the evaluator at this position. Runs every
+                evaluator when None.
+
+        Returns:
+            list[EvaluationResult]: One result per evaluator run, in evaluator order.
+        """
+        evaluators = get_worker_component("evaluators")
+        if index is not None:
+            evaluators = [evaluators[index]]
+        return EvaluationOrchestrator._evaluate_all(evaluators, true, pred, context)
+
+    async def _evaluate_on_pool(
+        self,
         loop: asyncio.AbstractEventLoop,
-        pool: ThreadPoolExecutor,
-        func: Callable[..., T],
-        *args: object,
-    ) -> T:
-        """Run a function in an executor while preserving contextvars.
+        pool: Executor,
+        true: ExtractionResult[ExtractionSchema],
+        pred: ExtractionResult[ExtractionSchema],
+        context: PipelineContext,
+    ) -> list[EvaluationResult]:
+        """Submits the evaluators for one example to the pool.
+
+        All evaluators run in a single submission unless ``parallel_evaluators``
+        is set and there is more than one evaluator, in which case each
+        evaluator is submitted separately.
 
         Args:
             loop (asyncio.AbstractEventLoop): The event loop to use.
-            pool (ThreadPoolExecutor): The thread pool to run the function in.
-            func (Callable[..., T]): The function to execute.
-            *args (object): Arguments to pass to the function.
+            pool (Executor): The shared pool for CPU-bound tasks.
+            true (ExtractionResult[ExtractionSchema]): Ground-truth data with metadata.
+            pred (ExtractionResult[ExtractionSchema]): Predicted data with metadata.
+            context (PipelineContext): Shared pipeline context.
 
         Returns:
-            The result of the function execution.
+            list[EvaluationResult]: One result per evaluator, in evaluator order.
         """
-        ctx = contextvars.copy_context()
-        return await loop.run_in_executor(pool, ctx.run, func, *args)
+        in_worker = self._uses_worker_components(pool)
+        if not self.config.parallel_evaluators or len(self.evaluators) == 1:
+            if in_worker:
+                return await self._run_on_pool(
+                    loop, pool, self._evaluate_all_in_worker, true, pred, context
+                )
+            return await self._run_on_pool(
+                loop, pool, self._evaluate_all, self.evaluators, true, pred, context
+            )
+
+        if in_worker:
+            submissions = [
+                self._run_on_pool(
+                    loop, pool, self._evaluate_all_in_worker, true, pred, context, index
+                )
+                for index in range(len(self.evaluators))
+            ]
+        else:
+            submissions = [
+                self._run_on_pool(
+                    loop, pool, self._evaluate_all, [evaluator], true, pred, context
+                )
+                for evaluator in self.evaluators
+            ]
+        batches = await asyncio.gather(*submissions)
+        return [result for batch in batches for result in batch]
 
     async def process_example(
         self,
         example: EvaluationExample[ExtractionSchema],
-        pool: ThreadPoolExecutor,
-        semaphore: asyncio.Semaphore,
+        pool: Executor,
+        semaphore: asyncio.Semaphore | None,
         context: PipelineContext,
     ) -> tuple[Document, list[EvaluationResult]]:
         """Runs extraction, evaluation, and export for a single example.
 
         Args:
             example (EvaluationExample[ExtractionSchema]): The evaluation example to process.
-            pool (ThreadPoolExecutor): The thread pool for CPU-bound tasks.
-            semaphore (asyncio.Semaphore): Semaphore to limit concurrency.
+            pool (Executor): The shared pool for CPU-bound tasks.
+            semaphore (asyncio.Semaphore | None): Semaphore limiting concurrent
+                extractor calls, or None if the caller already bounds concurrency.
             context (PipelineContext): Shared pipeline context.
 
         Returns:
@@ -203,67 +269,147 @@ class EvaluationOrchestrator(Generic[ExtractionSchema]):
         """
         loop = asyncio.get_running_loop()
 
-        document: Document = await self._run_in_executor_with_context(
-            loop,
-            pool,
-            self._ingest,
-            example.path_identifier,
-            self.reader,
-            self.converter,
-            context,
+        document: Document = await self._ingest_on_pool(
+            loop, pool, example.path_identifier, context
         )
 
-        async with semaphore:
+        # A caller-supplied semaphore covers only the extractor call, so
+        # evaluators do not hold up other examples' extractions. run() passes
+        # None: each of its workers holds its slot for the whole example.
+        async with semaphore or contextlib.nullcontext():
             pred: ExtractionResult[ExtractionSchema] = await self.extractor.extract(
                 document, self.schema, context
             )
 
-            evaluation_tasks = [
-                self._run_in_executor_with_context(
-                    loop, pool, evaluator.evaluate, example.true, pred, context
+        results = await self._evaluate_on_pool(loop, pool, example.true, pred, context)
+
+        logger.info("Completed evaluation for %s", document.id)
+        return document, results
+
+    async def _evaluation_worker(
+        self,
+        example_queue: asyncio.Queue[
+            tuple[int, EvaluationExample[ExtractionSchema]] | None
+        ],
+        results_queue: asyncio.Queue[
+            tuple[int, tuple[Document, list[EvaluationResult]]] | None
+        ],
+        context: PipelineContext,
+    ) -> None:
+        """Processes queued examples until a ``None`` sentinel is received.
+
+        Failed examples are logged and skipped; successful results are queued
+        for the export loop. The pool is looked up per example, so a process
+        pool replaced after a worker died is picked up by the rest of the run.
+
+        Args:
+            example_queue (asyncio.Queue[tuple[int, EvaluationExample[ExtractionSchema]] | None]):
+                Examples to process with their input positions, terminated by None.
+            results_queue (asyncio.Queue[tuple[int, tuple[Document, list[EvaluationResult]]] | None]):
+                Queue feeding successful results, tagged with their input
+                positions, to the export loop.
+            context (PipelineContext): Shared pipeline context.
+        """
+        while (item := await example_queue.get()) is not None:
+            index, example = item
+            try:
+                result = await self.process_example(
+                    example, self._get_pool(), None, context
                 )
-                for evaluator in self.evaluators
-            ]
-            results: list[EvaluationResult] = list(
-                await asyncio.gather(*evaluation_tasks)
-            )
+            except Exception:
+                logger.error(
+                    "Evaluation pipeline failed for %s",
+                    example.path_identifier,
+                    exc_info=True,
+                )
+            else:
+                await results_queue.put((index, result))
+
+    async def _export_results(
+        self,
+        results_queue: asyncio.Queue[
+            tuple[int, tuple[Document, list[EvaluationResult]]] | None
+        ],
+        context: PipelineContext,
+    ) -> None:
+        """Exports queued results until a None sentinel is received.
+
+        Results are exported every export_batch_size examples, in completion
+        order, when configured. Otherwise they are exported in a single call
+        once the queue is closed, in the order the examples were given.
+
+        Args:
+            results_queue (asyncio.Queue[tuple[int, tuple[Document, list[EvaluationResult]]] | None]):
+                Queue of completed results tagged with their input positions,
+                terminated by None.
+            context (PipelineContext): Shared pipeline context.
+        """
+        batch_size = self.config.export_batch_size
+        batch: list[tuple[int, tuple[Document, list[EvaluationResult]]]] = []
+
+        while (item := await results_queue.get()) is not None:
+            batch.append(item)
+            if batch_size is not None and len(batch) >= batch_size:
+                await self.evaluation_exporter.export(
+                    [result for _, result in batch], context
+                )
+                batch = []
 
-            logger.info("Completed evaluation for %s", document.id)
-            return document, results
+        if batch:
+            if batch_size is None:
+                batch.sort(key=lambda item: item[0])
+            await self.evaluation_exporter.export(
+                [result for _, result in batch], context
+            )
 
     async def run(
         self,
-        examples: list[EvaluationExample[ExtractionSchema]],
+        examples: (
+            Iterable[EvaluationExample[ExtractionSchema]]
+            | AsyncIterable[EvaluationExample[ExtractionSchema]]
+        ),
         context: PipelineContext | None = None,
     ) -> None:
         """Run all evaluators and export results for the provided examples.
 
+        Examples are scheduled as soon as they are produced, so an asynchronous
+        source can feed the pipeline while it is still loading. A fixed set of
+        max_concurrency workers processes them, so at most that many examples
+        are in flight at any time; failed examples are logged and left out of
+        the export. Results reach the exporter in a single call in input order,
+        or in batches of export_batch_size in completion order when it is set.
+
         Args:
-            examples (list[EvaluationExample[ExtractionSchema]]): The evaluation examples to evaluate.
+            examples (Iterable[EvaluationExample] | AsyncIterable[EvaluationExample]):
+                The evaluation examples to evaluate, as a list or a (possibly async) stream.
             context (PipelineContext | None): Optional shared pipeline context.
         """
         context = context or PipelineContext()
-        semaphore = asyncio.Semaphore(self.config.max_concurrency)
-
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
-            tasks = [
-                self.process_example(example, pool, semaphore, context)
-                for example in examples
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            valid_results: list[tuple[Document, list[EvaluationResult]]] = []
-
-            for example, result in zip(examples, results, strict=True):
-                if isinstance(result, BaseException):
-                    logger.error(
-                        "Evaluation pipeline failed for %s",
-                        example.path_identifier,
-                        exc_info=result,
+        num_workers = self.config.max_concurrency
+        # The export loop drains results as they arrive, so a small bound
+        # only makes workers wait while an export call is in progress.
+        results_queue: asyncio.Queue[
+            tuple[int, tuple[Document, list[EvaluationResult]]] | None
+        ] = asyncio.Queue(maxsize=self.config.export_batch_size or num_workers)
+
+        # A fixed set of workers bounds how many examples (and their
+        # documents) are alive at once, however large the input is.
+        example_queue: asyncio.Queue[
+            tuple[int, EvaluationExample[ExtractionSchema]] | None
+        ] = asyncio.Queue(maxsize=num_workers)
+        async with asyncio.TaskGroup() as task_group:
+            # Running the export loop in the group means a failed export
+            # cancels the workers instead of leaving them to run unbounded.
+            task_group.create_task(self._export_results(results_queue, context))
+            async with asyncio.TaskGroup() as worker_group:
+                for _ in range(num_workers):
+                    worker_group.create_task(
+                        self._evaluation_worker(example_queue, results_queue, context)
                     )
-                else:
-                    valid_results.append(result)
-
-            if valid_results:
-                await self.evaluation_exporter.export(valid_results, context)
+                index = 0
+                async for example in self._iter_items(examples):
+                    await example_queue.put((index, example))
+                    index += 1
+                for _ in range(num_workers):
+                    await example_queue.put(None)
+            await results_queue.put(None)
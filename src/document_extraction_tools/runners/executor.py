@@ -0,0 +1,107 @@
+"""Executors for the CPU-bound stages of the orchestrators.
+
+Ingestion and evaluation can run on threads or processes. Process workers do
+not share memory with the event loop, so the pipeline components they need are
+installed in each worker once through an initializer instead of being pickled
+with every submission.
+
+Subinterpreters are not offered: every payload crossing the worker boundary is
+a Pydantic model, and pydantic_core cannot be imported in a subinterpreter.
+"""
+
+import contextvars
+import functools
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, ParamSpec, TypeVar
+
+ExecutorType = Literal["thread", "process"]
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_worker_components: dict[str, Any] = {}
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool that runs each task in a copy of the submitter's context.
+
+    Contextvars set by the caller, such as tracing or logging state, are
+    visible to the task, and changes the task makes do not leak back.
+    """
+
+    def submit(
+        self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> Future[T]:
+        """Schedule ``fn`` to run in a copy of the current context.
+
+        Args:
+            fn (Callable[P, T]): The function to execute.
+            *args (P.args): Positional arguments to pass to the function.
+            **kwargs (P.kwargs): Keyword arguments to pass to the function.
+
+        Returns:
+            Future[T]: A future for the function's result.
+        """
+        ctx = contextvars.copy_context()
+        return super().submit(functools.partial(ctx.run, fn, *args, **kwargs))
+
+
+def _install_worker_components(components: dict[str, Any]) -> None:
+    """Store pipeline components in the current worker.
+
+    Args:
+        components (dict[str, Any]): The components to install, keyed by name.
+    """
+    _worker_components.update(components)
+
+
+def get_worker_component(name: str) -> Any:  # noqa: ANN401
+    """Return a component installed in the current worker.
+
+    Args:
+        name (str): The name the component was installed under.
+
+    Returns:
+        Any: The installed component.
+    """
+    return _worker_components[name]
+
+
+def create_executor(
+    executor_type: ExecutorType,
+    max_workers: int,
+    thread_name_prefix: str,
+    components: dict[str, Any],
+    max_tasks_per_child: int | None = None,
+) -> Executor:
+    """Create the executor for an orchestrator's CPU-bound tasks.
+
+    Args:
+        executor_type (ExecutorType): The kind of executor to create.
+        max_workers (int): The number of workers.
+        thread_name_prefix (str): Prefix for worker thread names.
+        components (dict[str, Any]): Components to install in process workers.
+            Ignored for thread pools, which share memory with the caller.
+            Process workers are spawned, so the components' classes must be
+            importable from a module.
+        max_tasks_per_child (int | None): Replace each worker process after this
+            many tasks. Only applies to process pools.
+
+    Returns:
+        Executor: The new executor.
+    """
+    if executor_type == "thread":
+        return ContextThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+    # Spawned workers start the same way on every platform and whether or not
+    # max_tasks_per_child is set, and do not inherit the event loop's threads.
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_install_worker_components,
+        initargs=(components,),
+        max_tasks_per_child=max_tasks_per_child,
+    )
@@ -6,11 +6,11 @@ concurrency to maximize throughput.
 """
 
 import asyncio
-import contextvars
+import contextlib
 import logging
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterable, Iterable
+from concurrent.futures import Executor
+from typing import Generic
 
 from document_extraction_tools.base.converter.base_converter import BaseConverter
 from document_extraction_tools.base.exporter.base_extraction_exporter import (
@@ -25,9 +25,9 @@ from document_extraction_tools.config.extraction_orchestrator_config import (
 from document_extraction_tools.config.extraction_pipeline_config import (
     ExtractionPipelineConfig,
 )
+from document_extraction_tools.runners.base_orchestrator import BaseOrchestrator
 from document_extraction_tools.types.context import PipelineContext
 from document_extraction_tools.types.document import Document
-from document_extraction_tools.types.document_bytes import DocumentBytes
 from document_extraction_tools.types.extraction_result import (
     ExtractionResult,
     ExtractionSchema,
@@ -35,14 +35,13 @@ from document_extraction_tools.types.extraction_result import (
 from document_extraction_tools.types.path_identifier import PathIdentifier
 
 logger = logging.getLogger(__name__)
-T = TypeVar("T")
 
 
-class ExtractionOrchestrator(Generic[ExtractionSchema]):
+class ExtractionOrchestrator(BaseOrchestrator, Generic[ExtractionSchema]):
     """Coordinates the document extraction pipeline.
 
     This class manages the lifecycle of document processing, ensuring that
-    CPU-bound tasks (Reading/Converting) are offloaded to a thread pool while
+    CPU-bound tasks (Reading/Converting) are offloaded to a worker pool while
     I/O-bound tasks (Extracting/Exporting) run concurrently in the async event
     loop.
 
@@ -56,6 +55,10 @@ class ExtractionOrchestrator(Generic[ExtractionSchema]):
         schema (type[ExtractionSchema]): Target extraction schema.
     """
 
+    thread_name_prefix = "extraction-orchestrator"
+
+    config: ExtractionOrchestratorConfig
+
     def __init__(
         self,
         config: ExtractionOrchestratorConfig,
@@ -84,6 +87,7 @@ class ExtractionOrchestrator(Generic[ExtractionSchema]):
         self.extractor = extractor
         self.extraction_exporter = extraction_exporter
         self.schema = schema
+        self._pool = None
 
     @classmethod
     def from_config(
@@ -127,116 +131,350 @@ class ExtractionOrchestrator(Generic[ExtractionSchema]):
             schema=schema,
         )
 
-    @staticmethod
-    def _ingest(
+    async def process_document(
+        self,
         path_identifier: PathIdentifier,
-        reader: BaseReader,
-        converter: BaseConverter,
+        pool: Executor,
+        semaphore: asyncio.Semaphore | None,
         context: PipelineContext,
-    ) -> Document:
-        """Performs the CPU-bound ingestion phase.
+    ) -> None:
+        """Runs the full processing lifecycle for a single document.
+
+        1. Ingest (Read+Convert) -> Offloaded to the worker pool (CPU).
+        2. Extract -> Async Wait (I/O).
+        3. Export -> Async Wait (I/O).
 
         Args:
-            path_identifier (PathIdentifier): The path identifier to the source file.
-            reader (BaseReader): The reader instance to use.
-            converter (BaseConverter): The converter instance to use.
+            path_identifier (PathIdentifier): The input file to process.
+            pool (Executor): The shared pool for CPU tasks.
+            semaphore (asyncio.Semaphore | None): The shared limiter on documents
+                in flight, or None if the caller already bounds concurrency.
             context (PipelineContext): Shared pipeline context.
-
-        Returns:
-            Document: The fully parsed document object.
         """
-        doc_bytes: DocumentBytes = reader.read(path_identifier, context)
-        return converter.convert(doc_bytes, context)
+        loop = asyncio.get_running_loop()
 
-    @staticmethod
-    async def _run_in_executor_with_context(
-        loop: asyncio.AbstractEventLoop,
-        pool: ThreadPoolExecutor,
-        func: Callable[..., T],
-        *args: object,
-    ) -> T:
-        """Run a function in an executor while preserving contextvars.
+        # Hold the semaphore across ingest too, so at most max_concurrency
+        # documents are ever held in memory at once.
+        async with semaphore or contextlib.nullcontext():
+            document: Document = await self._ingest_on_pool(
+                loop, pool, path_identifier, context
+            )
 
-        Args:
-            loop (asyncio.AbstractEventLoop): The event loop to use.
-            pool (ThreadPoolExecutor): The thread pool to run the function in.
-            func (Callable[..., T]): The function to execute.
-            *args (object): Arguments to pass to the function.
+            await self._extract_and_export(document, context)
 
-        Returns:
-            The result of the function execution.
+    async def _extract_and_export(
+        self, document: Document, context: PipelineContext
+    ) -> None:
+        """Extracts structured data from an ingested document and exports it.
+
+        Args:
+            document (Document): The ingested document.
+            context (PipelineContext): Shared pipeline context.
         """
-        ctx = contextvars.copy_context()
-        return await loop.run_in_executor(pool, ctx.run, func, *args)
+        extracted_data: ExtractionResult[ExtractionSchema] = (
+            await self.extractor.extract(document, self.schema, context)
+        )
+        await self.extraction_exporter.export(document, extracted_data, context)
 
-    async def process_document(
+        logger.info("Completed extraction for %s", document.id)
+
+    async def _ingest_stage(
         self,
-        path_identifier: PathIdentifier,
-        pool: ThreadPoolExecutor,
-        semaphore: asyncio.Semaphore,
+        path_queue: asyncio.Queue[PathIdentifier | None],
+        document_queue: asyncio.Queue[Document | None],
         context: PipelineContext,
     ) -> None:
-        """Runs the full processing lifecycle for a single document.
+        """Ingests queued paths on the worker pool and hands documents downstream.
 
-        1. Ingest (Read+Convert) -> Offloaded to ThreadPool (CPU).
-        2. Extract -> Async Wait (I/O).
-        3. Export -> Async Wait (I/O).
+        Runs until a ``None`` sentinel is received. Failures are logged and the
+        document is skipped. The pool is looked up per document, so a process
+        pool replaced after a worker died is picked up by the rest of the run.
 
         Args:
-            path_identifier (PathIdentifier): The input file to process.
-            pool (ThreadPoolExecutor): The shared pool for CPU tasks.
-            semaphore (asyncio.Semaphore): The shared limiter for I/O tasks.
+            path_queue (asyncio.Queue[PathIdentifier | None]): Paths to ingest.
+            document_queue (asyncio.Queue[Document | None]): Ingested documents.
             context (PipelineContext): Shared pipeline context.
         """
         loop = asyncio.get_running_loop()
+        while (path_identifier := await path_queue.get()) is not None:
+            try:
+                document: Document = await self._ingest_on_pool(
+                    loop, self._get_pool(), path_identifier, context
+                )
+            except Exception:
+                logger.error(
+                    "Extraction pipeline failed for %s", path_identifier, exc_info=True
+                )
+                continue
+            await document_queue.put(document)
+
+    async def _extract_stage(
+        self,
+        document_queue: asyncio.Queue[Document | None],
+        result_queue: asyncio.Queue[
+            list[tuple[Document, ExtractionResult[ExtractionSchema]]] | None
+        ],
+        io_limit: asyncio.Semaphore,
+        context: PipelineContext,
+    ) -> None:
+        """Extracts queued documents and hands the results to the export stage.
+
+        Runs until a ``None`` sentinel is received. When ``extraction_batch_size``
+        is set, documents are collected into batches. Each batch is sent in one
+        ``extract_batch`` call if the extractor overrides it; otherwise each
+        document is extracted with its own ``extract`` call, so failures stay
+        per document and every call counts against ``io_limit``. Failures are
+        logged and the affected documents are skipped.
+
+        Args:
+            document_queue (asyncio.Queue[Document | None]): Ingested documents.
+            result_queue (asyncio.Queue[list[tuple[Document, ExtractionResult[ExtractionSchema]]] | None]):
+                Extracted results, one list per document or batch.
+            io_limit (asyncio.Semaphore): Limit on extractor and exporter calls
+                in flight, shared with the export stage.
+            context (PipelineContext): Shared pipeline context.
+        """
+        batch_size = self.config.extraction_batch_size
+        if batch_size is None:
+            while (document := await document_queue.get()) is not None:
+                extracted_data = await self._extract_one(document, io_limit, context)
+                if extracted_data is not None:
+                    await result_queue.put([(document, extracted_data)])
+            return
+
+        use_extract_batch = (
+            type(self.extractor).extract_batch is not BaseExtractor.extract_batch
+        )
+        done = False
+        while not done:
+            batch, done = await self._collect_batch(document_queue, batch_size)
+            if not batch:
+                continue
+            if not use_extract_batch:
+                outcomes = await asyncio.gather(
+                    *(
+                        self._extract_one(document, io_limit, context)
+                        for document in batch
+                    )
+                )
+                paired = [
+                    (document, extracted_data)
+                    for document, extracted_data in zip(batch, outcomes, strict=True)
+                    if extracted_data is not None
+                ]
+                if paired:
+                    await result_queue.put(paired)
+                continue
+            try:
+                async with io_limit:
+                    results = await self.extractor.extract_batch(
+                        batch, self.schema, context
+                    )
+                paired = list(zip(batch, results, strict=True))
+            except Exception:
+                self._log_failures(batch)
+                continue
+            await result_queue.put(paired)
+
+    async def _extract_one(
+        self,
+        document: Document,
+        io_limit: asyncio.Semaphore,
+        context: PipelineContext,
+    ) -> ExtractionResult[ExtractionSchema] | None:
+        """Extracts a single document, logging any failure.
+
+        Args:
+            document (Document): The ingested document.
+            io_limit (asyncio.Semaphore): Limit on extractor and exporter calls
+                in flight.
+            context (PipelineContext): Shared pipeline context.
+
+        Returns:
+            ExtractionResult[ExtractionSchema] | None: The extracted data, or None
+                if extraction failed.
+        """
+        try:
+            async with io_limit:
+                return await self.extractor.extract(document, self.schema, context)
+        except Exception:
+            self._log_failures([document])
+            return None
+
+    async def _export_stage(
+        self,
+        result_queue: asyncio.Queue[
+            list[tuple[Document, ExtractionResult[ExtractionSchema]]] | None
+        ],
+        io_limit: asyncio.Semaphore,
+        context: PipelineContext,
+    ) -> None:
+        """Exports extracted results until a ``None`` sentinel.
 
-        document: Document = await self._run_in_executor_with_context(
-            loop,
-            pool,
-            self._ingest,
-            path_identifier,
-            self.reader,
-            self.converter,
-            context,
+        Results from batched extraction are exported with one ``export_batch``
+        call when the exporter overrides it. Otherwise each result is exported
+        on its own, so a failure only affects that document. Failures are
+        logged and the affected documents are skipped.
+
+        Args:
+            result_queue (asyncio.Queue[list[tuple[Document, ExtractionResult[ExtractionSchema]]] | None]):
+                Extracted results, one list per extractor call.
+            io_limit (asyncio.Semaphore): Limit on extractor and exporter calls
+                in flight, shared with the extract stage.
+            context (PipelineContext): Shared pipeline context.
+        """
+        use_export_batch = (
+            self.config.extraction_batch_size is not None
+            and type(self.extraction_exporter).export_batch
+            is not BaseExtractionExporter.export_batch
         )
+        while (results := await result_queue.get()) is not None:
+            if use_export_batch:
+                documents = [document for document, _ in results]
+                try:
+                    async with io_limit:
+                        await self.extraction_exporter.export_batch(results, context)
+                except Exception:
+                    self._log_failures(documents)
+                    continue
+                for document in documents:
+                    logger.info("Completed extraction for %s", document.id)
+                continue
+
+            for document, extracted_data in results:
+                try:
+                    async with io_limit:
+                        await self.extraction_exporter.export(
+                            document, extracted_data, context
+                        )
+                except Exception:
+                    self._log_failures([document])
+                    continue
+                logger.info("Completed extraction for %s", document.id)
+
+    @staticmethod
+    def _log_failures(documents: list[Document]) -> None:
+        """Logs the current exception against each affected document.
 
-        async with semaphore:
-            extracted_data: ExtractionResult[ExtractionSchema] = (
-                await self.extractor.extract(document, self.schema, context)
+        Args:
+            documents (list[Document]): The documents that failed.
+        """
+        for document in documents:
+            logger.error(
+                "Extraction pipeline failed for %s",
+                document.path_identifier,
+                exc_info=True,
             )
-            await self.extraction_exporter.export(document, extracted_data, context)
 
-            logger.info("Completed extraction for %s", document.id)
+    async def _collect_batch(
+        self, document_queue: asyncio.Queue[Document | None], batch_size: int
+    ) -> tuple[list[Document], bool]:
+        """Collects up to ``batch_size`` documents from the queue.
+
+        Waits for the first document and takes any documents already queued,
+        then waits for at most ``extraction_batch_delay`` seconds for the rest
+        of the batch.
+
+        Args:
+            document_queue (asyncio.Queue[Document | None]): Ingested documents.
+            batch_size (int): The maximum number of documents per batch.
+
+        Returns:
+            tuple[list[Document], bool]: The batch, and whether the ``None``
+                sentinel was received.
+        """
+        loop = asyncio.get_running_loop()
+        batch: list[Document] = []
+        deadline: float | None = None
+        while len(batch) < batch_size:
+            if deadline is None:
+                document = await document_queue.get()
+                deadline = loop.time() + self.config.extraction_batch_delay
+            elif not document_queue.empty():
+                document = document_queue.get_nowait()
+            else:
+                try:
+                    document = await asyncio.wait_for(
+                        document_queue.get(), deadline - loop.time()
+                    )
+                except TimeoutError:
+                    break
+            if document is None:
+                return batch, True
+            batch.append(document)
+        return batch, False
 
     async def run(
         self,
-        file_paths_to_process: list[PathIdentifier],
+        file_paths_to_process: Iterable[PathIdentifier] | AsyncIterable[PathIdentifier],
         context: PipelineContext | None = None,
     ) -> None:
         """Main entry point. Orchestrates the execution of the provided file list.
 
+        Documents flow through three stages connected by bounded queues:
+        ``max_workers`` ingest workers read and convert on the worker pool (plus
+        ``io_max_workers`` more when reads have their own pool),
+        ``max_concurrency`` extract workers call the extractor, and
+        ``max_concurrency`` export workers persist the results, so CPU work,
+        extraction and export overlap. Extractor and exporter calls share one
+        limit, so at most ``max_concurrency`` of them are in flight at once.
+        Paths are consumed as they are produced, so an asynchronous source (e.g.
+        a lister that walks a large directory) can feed the pipeline while it is
+        still discovering files.
+
         Args:
-            file_paths_to_process (list[PathIdentifier]): The list of file paths to process.
+            file_paths_to_process (Iterable[PathIdentifier] | AsyncIterable[PathIdentifier]):
+                The file paths to process, as a list or a (possibly async) stream.
             context (PipelineContext | None): Optional shared pipeline context.
         """
         context = context or PipelineContext()
-        semaphore = asyncio.Semaphore(self.config.max_concurrency)
-
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
-
-            tasks = [
-                self.process_document(path_identifier, pool, semaphore, context)
-                for path_identifier in file_paths_to_process
+        # With a separate reader pool, keep every reader and converter busy.
+        num_ingest_workers = self.config.max_workers + (self.config.io_max_workers or 0)
+        num_extract_workers = self.config.max_concurrency
+        num_export_workers = self.config.max_concurrency
+
+        # Bounded stages: ingest workers keep the worker pool busy, extract
+        # workers do not wait on exports, and the queue sizes cap how many
+        # documents are held in memory at once. Extractor and exporter calls
+        # share io_limit, so their total stays within max_concurrency.
+        io_limit = asyncio.Semaphore(self.config.max_concurrency)
+        path_queue: asyncio.Queue[PathIdentifier | None] = asyncio.Queue(
+            maxsize=num_ingest_workers
+        )
+        document_queue: asyncio.Queue[Document | None] = asyncio.Queue(
+            maxsize=2 * num_extract_workers
+        )
+        result_queue: asyncio.Queue[
+            list[tuple[Document, ExtractionResult[ExtractionSchema]]] | None
+        ] = asyncio.Queue(maxsize=2 * num_export_workers)
+
+        async with asyncio.TaskGroup() as task_group:
+            ingest_tasks = [
+                task_group.create_task(
+                    self._ingest_stage(path_queue, document_queue, context)
+                )
+                for _ in range(num_ingest_workers)
             ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for path_identifier, result in zip(
-                file_paths_to_process, results, strict=True
-            ):
-                if isinstance(result, BaseException):
-                    logger.error(
-                        "Extraction pipeline failed for %s",
-                        path_identifier,
-                        exc_info=result,
-                    )
+            extract_tasks = [
+                task_group.create_task(
+                    self._extract_stage(document_queue, result_queue, io_limit, context)
+                )
+                for _ in range(num_extract_workers)
+            ]
+            for _ in range(num_export_workers):
+                task_group.create_task(
+                    self._export_stage(result_queue, io_limit, context)
+                )
+
+            async for path_identifier in self._iter_items(file_paths_to_process):
+                await path_queue.put(path_identifier)
+            for _ in range(num_ingest_workers):
+                await path_queue.put(None)
+
+            await asyncio.gather(*ingest_tasks)
+            for _ in range(num_extract_workers):
+                await document_queue.put(None)
+
+            await asyncio.gather(*extract_tasks)
+            for _ in range(num_export_workers):
+                await result_queue.put(None)
@@ -5,7 +5,7 @@ This model acts as a container for file content before any parsing occurs.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from document_extraction_tools.types.path_identifier import PathIdentifier
 
@@ -17,6 +17,9 @@ class DocumentBytes(BaseModel):
     It guarantees that the processor receives raw bytes regardless of origin.
     """
 
+    # Binary files are not valid UTF-8, so JSON round-trips use base64.
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     file_bytes: bytes = Field(..., description="The raw binary content of the file.")
 
     path_identifier: PathIdentifier = Field(
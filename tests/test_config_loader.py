@@ -1,9 +1,11 @@
 """Tests for config loader utilities."""
 
+import os
 from pathlib import Path
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
 from document_extraction_tools.config import (
     BaseConverterConfig,
@@ -14,6 +16,7 @@ from document_extraction_tools.config import (
     BaseFileListerConfig,
     BaseReaderConfig,
     BaseTestDataLoaderConfig,
+    clear_config_cache,
     load_evaluation_config,
     load_extraction_config,
 )
@@ -57,6 +60,34 @@ def test_load_yaml_empty_returns_empty_dict(tmp_path: Path) -> None:
     assert _load_yaml(target) == {}
 
 
+def test_load_yaml_reparses_after_edit(tmp_path: Path) -> None:
+    """Reuse cached parses without sharing state, and pick up file edits."""
+    target = tmp_path / "component.yaml"
+    _write_yaml(target, {"value": 1})
+
+    first = _load_yaml(target)
+    first["value"] = 99
+    assert _load_yaml(target) == {"value": 1}
+
+    _write_yaml(target, {"value": 12345})
+    assert _load_yaml(target) == {"value": 12345}
+
+
+def test_clear_config_cache_rereads_unchanged_stat(tmp_path: Path) -> None:
+    """Read a file again after clearing the cache, even if its stat is unchanged."""
+    target = tmp_path / "component.yaml"
+    _write_yaml(target, {"value": 1})
+    stat = target.stat()
+    assert _load_yaml(target) == {"value": 1}
+
+    _write_yaml(target, {"value": 2})
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _load_yaml(target) == {"value": 1}
+
+    clear_config_cache()
+    assert _load_yaml(target) == {"value": 2}
+
+
 def test_load_extraction_config_builds_pipeline_config(tmp_path: Path) -> None:
     """Build an extraction pipeline config from per-component YAML files."""
     config_dir = tmp_path / "config"
@@ -201,3 +232,35 @@ def test_load_evaluator_configs_allows_none_config(tmp_path: Path) -> None:
 
     assert len(evaluators) == 1
     assert isinstance(evaluators[0], DummyEvaluatorConfig)
+
+
+def test_load_extraction_config_rejects_unknown_keys(tmp_path: Path) -> None:
+    """Raise when a component YAML contains keys the config does not declare."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+
+    _write_yaml(config_dir / ExtractionOrchestratorConfig.filename, {"max_wrokers": 2})
+    _write_yaml(config_dir / BaseFileListerConfig.filename, {})
+    _write_yaml(config_dir / BaseReaderConfig.filename, {})
+    _write_yaml(config_dir / BaseConverterConfig.filename, {})
+    _write_yaml(config_dir / BaseExtractorConfig.filename, {})
+    _write_yaml(config_dir / BaseExtractionExporterConfig.filename, {})
+
+    with pytest.raises(ValidationError, match="max_wrokers"):
+        load_extraction_config(
+            lister_config_cls=BaseFileListerConfig,
+            reader_config_cls=BaseReaderConfig,
+            converter_config_cls=BaseConverterConfig,
+            extractor_config_cls=BaseExtractorConfig,
+            extraction_exporter_config_cls=BaseExtractionExporterConfig,
+            extraction_orchestrator_config_cls=ExtractionOrchestratorConfig,
+            config_dir=config_dir,
+        )
+
+
+def test_configs_are_immutable() -> None:
+    """Reject attribute assignment on loaded configs."""
+    config = ExtractionOrchestratorConfig()
+
+    with pytest.raises(ValidationError):
+        config.max_workers = 8
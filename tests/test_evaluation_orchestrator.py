@@ -2,6 +2,8 @@
 
 import asyncio
 import contextvars
+import threading
+from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
@@ -28,6 +30,7 @@ from document_extraction_tools.config import (
 from document_extraction_tools.runners import (
     EvaluationOrchestrator,
 )
+from document_extraction_tools.runners.executor import ContextThreadPoolExecutor
 from document_extraction_tools.types import (
     Document,
     DocumentBytes,
@@ -208,7 +211,7 @@ def test_from_config_wires_components_and_evaluators() -> None:
 
 
 @pytest.mark.asyncio
-async def test_run_in_executor_with_context_preserves_contextvars() -> None:
+async def test_context_thread_pool_preserves_contextvars() -> None:
     """Keep contextvars values when running in the executor."""
     token = contextvars.ContextVar("token", default="missing")
     token.set("present")
@@ -217,10 +220,8 @@ async def test_run_in_executor_with_context_preserves_contextvars() -> None:
         return token.get()
 
     loop = asyncio.get_running_loop()
-    with ThreadPoolExecutor(max_workers=1) as pool:
-        result = await EvaluationOrchestrator._run_in_executor_with_context(
-            loop, pool, read_token
-        )
+    with ContextThreadPoolExecutor(max_workers=1) as pool:
+        result = await loop.run_in_executor(pool, read_token)
 
     assert result == "present"
 
@@ -250,6 +251,28 @@ def test_from_config_missing_evaluator_config_raises() -> None:
         )
 
 
+def test_evaluator_resolves_config_by_declared_class() -> None:
+    """Select the evaluator config by config_cls rather than by name."""
+
+    class RenamedEvaluator(DummyEvaluator):
+        config_cls = DummyEvaluatorConfig
+
+    evaluator_config = DummyEvaluatorConfig()
+    config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[evaluator_config],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+
+    evaluator = RenamedEvaluator(config)
+
+    assert evaluator.config is evaluator_config
+
+
 @pytest.mark.asyncio
 async def test_process_example_runs_pipeline() -> None:
     """Run extraction and evaluation for one example."""
@@ -331,3 +354,374 @@ async def test_run_exports_only_valid_results() -> None:
     assert len(exporter.export_calls) == 1
     exported_docs = [doc.id for doc, _ in exporter.export_calls[0]]
     assert exported_docs == ["doc-ok"]
+
+
+@pytest.mark.asyncio
+async def test_run_accepts_async_iterable() -> None:
+    """Evaluate examples streamed from an async source."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+    exporter = DummyEvaluationExporter(pipeline_config)
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        evaluators=[DummyEvaluator(pipeline_config)],
+        evaluation_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    async def stream_examples() -> AsyncIterator[EvaluationExample[DummySchema]]:
+        for name in ("doc-1", "doc-2"):
+            yield EvaluationExample(
+                id=name,
+                path_identifier=PathIdentifier(path=name),
+                true=ExtractionResult(data=DummySchema(value=f"pred:{name}")),
+            )
+
+    await orchestrator.run(stream_examples())
+
+    assert len(exporter.export_calls) == 1
+    exported_docs = {doc.id for doc, _ in exporter.export_calls[0]}
+    assert exported_docs == {"doc-1", "doc-2"}
+
+
+@pytest.mark.asyncio
+async def test_async_context_reuses_pool_across_runs() -> None:
+    """Share one thread pool across runs inside an async with block."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+    exporter = DummyEvaluationExporter(pipeline_config)
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        evaluators=[DummyEvaluator(pipeline_config)],
+        evaluation_exporter=exporter,
+        schema=DummySchema,
+    )
+    examples: list[EvaluationExample[DummySchema]] = [
+        EvaluationExample(
+            id="example-1",
+            path_identifier=PathIdentifier(path="doc-1"),
+            true=ExtractionResult(data=DummySchema(value="pred:doc-1")),
+        )
+    ]
+
+    async with orchestrator:
+        pool = orchestrator._pool
+        assert pool is not None
+        await orchestrator.run(examples)
+        await orchestrator.run(examples)
+        assert orchestrator._pool is pool
+
+    assert orchestrator._pool is None
+    assert len(exporter.export_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_process_example_runs_every_evaluator() -> None:
+    """Return one result per evaluator from a single executor submission."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+    evaluators = [DummyEvaluator(pipeline_config), DummyEvaluator(pipeline_config)]
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        evaluators=evaluators,
+        evaluation_exporter=DummyEvaluationExporter(pipeline_config),
+        schema=DummySchema,
+    )
+
+    example: EvaluationExample[DummySchema] = EvaluationExample(
+        id="example-1",
+        path_identifier=PathIdentifier(path="doc-1"),
+        true=ExtractionResult(data=DummySchema(value="pred:doc-1")),
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        _, results = await orchestrator.process_example(
+            example, pool, asyncio.Semaphore(1), PipelineContext()
+        )
+
+    assert [result.result for result in results] == [True, True]
+    assert all(len(evaluator.evaluate_calls) == 1 for evaluator in evaluators)
+
+
+@pytest.mark.asyncio
+async def test_process_example_runs_evaluators_in_parallel() -> None:
+    """Run an example's evaluators concurrently when parallel_evaluators is set."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(parallel_evaluators=True),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BlockingEvaluator(DummyEvaluator):
+        config_cls = DummyEvaluatorConfig
+
+        def evaluate(
+            self,
+            true: ExtractionResult[DummySchema],
+            pred: ExtractionResult[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> EvaluationResult:
+            # Only passes once both evaluators are running at the same time.
+            barrier.wait()
+            return super().evaluate(true, pred, _context)
+
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        evaluators=[
+            BlockingEvaluator(pipeline_config),
+            BlockingEvaluator(pipeline_config),
+        ],
+        evaluation_exporter=DummyEvaluationExporter(pipeline_config),
+        schema=DummySchema,
+    )
+
+    example: EvaluationExample[DummySchema] = EvaluationExample(
+        id="example-1",
+        path_identifier=PathIdentifier(path="doc-1"),
+        true=ExtractionResult(data=DummySchema(value="pred:doc-1")),
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        _, results = await orchestrator.process_example(
+            example, pool, asyncio.Semaphore(1), PipelineContext()
+        )
+
+    assert [result.result for result in results] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_run_exports_in_batches() -> None:
+    """Flush results to the exporter every export_batch_size examples."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(export_batch_size=2),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+    exporter = DummyEvaluationExporter(pipeline_config)
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        evaluators=[DummyEvaluator(pipeline_config)],
+        evaluation_exporter=exporter,
+        schema=DummySchema,
+    )
+    examples: list[EvaluationExample[DummySchema]] = [
+        EvaluationExample(
+            id=f"example-{index}",
+            path_identifier=PathIdentifier(path=f"doc-{index}"),
+            true=ExtractionResult(data=DummySchema(value=f"pred:doc-{index}")),
+        )
+        for index in range(5)
+    ]
+
+    await orchestrator.run(examples)
+
+    assert [len(batch) for batch in exporter.export_calls] == [2, 2, 1]
+    exported_docs = {doc.id for batch in exporter.export_calls for doc, _ in batch}
+    assert exported_docs == {f"doc-{index}" for index in range(5)}
+
+
+@pytest.mark.asyncio
+async def test_run_bounds_examples_in_flight() -> None:
+    """Process at most max_concurrency examples at once."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(max_concurrency=2),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+    in_flight = 0
+    peak = 0
+
+    class SlowExtractor(DummyExtractor):
+        async def extract(
+            self,
+            document: Document,
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> ExtractionResult[DummySchema]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await super().extract(document, schema, _context)
+
+    exporter = DummyEvaluationExporter(pipeline_config)
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=SlowExtractor(pipeline_config),
+        evaluators=[DummyEvaluator(pipeline_config)],
+        evaluation_exporter=exporter,
+        schema=DummySchema,
+    )
+    examples: list[EvaluationExample[DummySchema]] = [
+        EvaluationExample(
+            id=f"example-{index}",
+            path_identifier=PathIdentifier(path=f"doc-{index}"),
+            true=ExtractionResult(data=DummySchema(value=f"pred:doc-{index}")),
+        )
+        for index in range(6)
+    ]
+
+    await orchestrator.run(examples)
+
+    assert peak == 2
+    assert len(exporter.export_calls[0]) == 6
+
+
+@pytest.mark.asyncio
+async def test_run_exports_in_input_order() -> None:
+    """Export results in input order when they complete out of order."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+
+    class ReverseOrderExtractor(DummyExtractor):
+        async def extract(
+            self,
+            document: Document,
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> ExtractionResult[DummySchema]:
+            index = int(document.id.removeprefix("doc-"))
+            await asyncio.sleep(0.005 * (4 - index))
+            return await super().extract(document, schema, _context)
+
+    exporter = DummyEvaluationExporter(pipeline_config)
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=ReverseOrderExtractor(pipeline_config),
+        evaluators=[DummyEvaluator(pipeline_config)],
+        evaluation_exporter=exporter,
+        schema=DummySchema,
+    )
+    examples: list[EvaluationExample[DummySchema]] = [
+        EvaluationExample(
+            id=f"example-{index}",
+            path_identifier=PathIdentifier(path=f"doc-{index}"),
+            true=ExtractionResult(data=DummySchema(value=f"pred:doc-{index}")),
+        )
+        for index in range(5)
+    ]
+
+    await orchestrator.run(examples)
+
+    assert [doc.id for doc, _ in exporter.export_calls[0]] == [
+        f"doc-{index}" for index in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_stops_workers_when_export_fails() -> None:
+    """Cancel the remaining examples once an export call raises."""
+    pipeline_config = EvaluationPipelineConfig(
+        evaluation_orchestrator=EvaluationOrchestratorConfig(
+            max_concurrency=1, export_batch_size=2
+        ),
+        test_data_loader=BaseTestDataLoaderConfig(),
+        evaluators=[DummyEvaluatorConfig()],
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        evaluation_exporter=BaseEvaluationExporterConfig(),
+    )
+
+    class FailingExporter(DummyEvaluationExporter):
+        async def export(
+            self,
+            results: list[tuple[Document, list[EvaluationResult]]],
+            _context: PipelineContext | None = None,
+        ) -> None:
+            self.export_calls.append(results)
+            raise RuntimeError("export failed")
+
+    extractor = DummyExtractor(pipeline_config)
+    orchestrator = EvaluationOrchestrator(
+        config=pipeline_config.evaluation_orchestrator,
+        test_data_loader=DummyTestDataLoader(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=extractor,
+        evaluators=[DummyEvaluator(pipeline_config)],
+        evaluation_exporter=FailingExporter(pipeline_config),
+        schema=DummySchema,
+    )
+    examples: list[EvaluationExample[DummySchema]] = [
+        EvaluationExample(
+            id=f"example-{index}",
+            path_identifier=PathIdentifier(path=f"doc-{index}"),
+            true=ExtractionResult(data=DummySchema(value=f"pred:doc-{index}")),
+        )
+        for index in range(20)
+    ]
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await orchestrator.run(examples)
+
+    assert exc_info.group_contains(RuntimeError, match="export failed")
+    assert len(extractor.extract_calls) < 20
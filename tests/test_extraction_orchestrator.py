@@ -2,10 +2,17 @@
 
 import asyncio
 import contextvars
-from concurrent.futures import ThreadPoolExecutor
+import gc
+import logging
+import os
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 
 from document_extraction_tools.base import (
     BaseConverter,
@@ -26,6 +33,10 @@ from document_extraction_tools.config import (
 from document_extraction_tools.runners import (
     ExtractionOrchestrator,
 )
+from document_extraction_tools.runners.executor import (
+    ContextThreadPoolExecutor,
+    create_executor,
+)
 from document_extraction_tools.types import (
     Document,
     DocumentBytes,
@@ -103,6 +114,18 @@ class DummyConverter(BaseConverter):
         )
 
 
+class CrashingConverter(DummyConverter):
+    """Converter stub that kills its worker process on the "crash" document."""
+
+    def convert(
+        self, document_bytes: DocumentBytes, _context: PipelineContext | None = None
+    ) -> Document:
+        """Exit the process for the crash document, otherwise convert."""
+        if document_bytes.path_identifier.path == "crash":
+            os._exit(1)
+        return super().convert(document_bytes, _context)
+
+
 class DummyExtractor(BaseExtractor):
     """Extractor stub that can be configured to fail."""
 
@@ -180,7 +203,7 @@ def test_from_config_wires_components() -> None:
 
 
 @pytest.mark.asyncio
-async def test_run_in_executor_with_context_preserves_contextvars() -> None:
+async def test_context_thread_pool_preserves_contextvars() -> None:
     """Keep contextvars values when running in the executor."""
     token = contextvars.ContextVar("token", default="missing")
     token.set("present")
@@ -189,10 +212,8 @@ async def test_run_in_executor_with_context_preserves_contextvars() -> None:
         return token.get()
 
     loop = asyncio.get_running_loop()
-    with ThreadPoolExecutor(max_workers=1) as pool:
-        result = await ExtractionOrchestrator._run_in_executor_with_context(
-            loop, pool, read_token
-        )
+    with ContextThreadPoolExecutor(max_workers=1) as pool:
+        result = await loop.run_in_executor(pool, read_token)
 
     assert result == "present"
 
@@ -266,3 +287,764 @@ async def test_run_skips_failed_documents() -> None:
 
     exported_ids = {doc.id for doc, _ in exporter.export_calls}
     assert exported_ids == {"doc-ok"}
+
+
+@pytest.mark.asyncio
+async def test_run_accepts_async_iterable() -> None:
+    """Process documents streamed from an async source."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    async def stream_paths() -> AsyncIterator[PathIdentifier]:
+        for name in ("doc-1", "doc-2"):
+            yield PathIdentifier(path=name)
+
+    await orchestrator.run(stream_paths())
+
+    exported_ids = {doc.id for doc, _ in exporter.export_calls}
+    assert exported_ids == {"doc-1", "doc-2"}
+
+
+@pytest.mark.asyncio
+async def test_iter_files_defaults_to_list_files() -> None:
+    """Yield the identifiers returned by list_files from iter_files."""
+
+    class ListingFileLister(DummyFileLister):
+        def list_files(
+            self, _context: PipelineContext | None = None
+        ) -> list[PathIdentifier]:
+            return [PathIdentifier(path="doc-1"), PathIdentifier(path="doc-2")]
+
+    lister = ListingFileLister(BaseFileListerConfig())
+
+    paths = [path.path async for path in lister.iter_files()]
+
+    assert paths == ["doc-1", "doc-2"]
+
+
+@pytest.mark.asyncio
+async def test_run_reuses_pool_until_aclose() -> None:
+    """Keep the thread pool across runs and release it on aclose."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    await orchestrator.run([PathIdentifier(path="doc-1")])
+    pool = orchestrator._pool
+    await orchestrator.run([PathIdentifier(path="doc-2")])
+
+    assert pool is not None
+    assert orchestrator._pool is pool
+    assert len(exporter.export_calls) == 2
+
+    await orchestrator.aclose()
+
+    assert orchestrator._pool is None
+
+
+@pytest.mark.asyncio
+async def test_run_bounds_each_stage() -> None:
+    """Cap ingest at max_workers and extraction at max_concurrency."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_workers=2, max_concurrency=1
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    lock = threading.Lock()
+    active_reads = 0
+    peak_reads = 0
+    active_extracts = 0
+    peak_extracts = 0
+
+    class CountingReader(DummyReader):
+        def read(
+            self,
+            path_identifier: PathIdentifier,
+            _context: PipelineContext | None = None,
+        ) -> DocumentBytes:
+            nonlocal active_reads, peak_reads
+            with lock:
+                active_reads += 1
+                peak_reads = max(peak_reads, active_reads)
+            time.sleep(0.01)
+            with lock:
+                active_reads -= 1
+            return super().read(path_identifier, _context)
+
+    class CountingExtractor(DummyExtractor):
+        async def extract(
+            self,
+            document: Document,
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> ExtractionResult[DummySchema]:
+            nonlocal active_extracts, peak_extracts
+            active_extracts += 1
+            peak_extracts = max(peak_extracts, active_extracts)
+            await asyncio.sleep(0.01)
+            active_extracts -= 1
+            return await super().extract(document, schema, _context)
+
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=CountingReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=CountingExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    async with orchestrator:
+        await orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(6)])
+
+    assert peak_reads <= 2
+    assert peak_extracts == 1
+    assert len(exporter.export_calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_run_on_process_pool() -> None:
+    """Ingest with components installed in worker processes."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_workers=2, executor_type="process"
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    reader = DummyReader(pipeline_config)
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=reader,
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    async with orchestrator:
+        await orchestrator.run(
+            [PathIdentifier(path="doc-1"), PathIdentifier(path="doc-2")]
+        )
+
+    assert orchestrator._pool is None
+    # Reads happen on the workers' copies of the reader, not this one.
+    assert reader.read_calls == []
+    exported_ids = {doc.id for doc, _ in exporter.export_calls}
+    assert exported_ids == {"doc-1", "doc-2"}
+
+
+@pytest.mark.asyncio
+async def test_run_replaces_broken_process_pool() -> None:
+    """Recreate the process pool after a worker dies."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_workers=1, executor_type="process"
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=CrashingConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    async with orchestrator:
+        await orchestrator.run(
+            [PathIdentifier(path="crash"), PathIdentifier(path="doc-1")]
+        )
+        await orchestrator.run(
+            [PathIdentifier(path="doc-2"), PathIdentifier(path="doc-3")]
+        )
+
+    exported_ids = {doc.id for doc, _ in exporter.export_calls}
+    assert exported_ids == {"doc-1", "doc-2", "doc-3"}
+
+
+class CustomThreadPool(ThreadPoolExecutor):
+    """Thread pool subclass supplied by a caller."""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pool_factory",
+    [
+        lambda: CustomThreadPool(max_workers=1),
+        lambda: ProcessPoolExecutor(max_workers=1),
+    ],
+    ids=["thread-subclass", "process"],
+)
+async def test_process_document_accepts_caller_pools(
+    pool_factory: Callable[[], Executor],
+) -> None:
+    """Send components with each task on pools the orchestrator did not create."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    with pool_factory() as pool:
+        await orchestrator.process_document(
+            PathIdentifier(path="doc-1"), pool, None, PipelineContext()
+        )
+
+    assert [doc.id for doc, _ in exporter.export_calls] == ["doc-1"]
+
+
+def test_process_executor_recycles_workers() -> None:
+    """Replace each worker process after max_tasks_per_child tasks."""
+    pool = create_executor(
+        "process",
+        max_workers=1,
+        thread_name_prefix="test",
+        components={},
+        max_tasks_per_child=2,
+    )
+
+    try:
+        pids = [pool.submit(os.getpid).result() for _ in range(4)]
+    finally:
+        pool.shutdown()
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[1] != pids[2]
+
+
+def test_extractor_json_schema_is_cached_copy() -> None:
+    """Return the schema's JSON schema without sharing mutable state."""
+    first = BaseExtractor.json_schema(DummySchema)
+    first["title"] = "changed"
+
+    second = BaseExtractor.json_schema(DummySchema)
+
+    assert second == DummySchema.model_json_schema()
+
+
+def test_extractor_json_schema_cache_releases_schema() -> None:
+    """Let runtime schema classes be garbage collected after use."""
+    schema = create_model("RuntimeSchema", value=(str, ...))
+    BaseExtractor.json_schema(schema)
+    schema_ref = weakref.ref(schema)
+
+    del schema
+    gc.collect()
+
+    assert schema_ref() is None
+
+
+@pytest.mark.asyncio
+async def test_run_extracts_in_batches() -> None:
+    """Extract and export in batches when a batch size is configured."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_concurrency=1, extraction_batch_size=2, extraction_batch_delay=1.0
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    batch_sizes: list[int] = []
+
+    class BatchingExtractor(DummyExtractor):
+        async def extract_batch(
+            self,
+            documents: list[Document],
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> list[ExtractionResult[DummySchema]]:
+            batch_sizes.append(len(documents))
+            return await super().extract_batch(documents, schema, _context)
+
+    export_batch_sizes: list[int] = []
+
+    class BatchingExporter(DummyExporter):
+        async def export_batch(
+            self,
+            results: list[tuple[Document, ExtractionResult[DummySchema]]],
+            context: PipelineContext | None = None,
+        ) -> None:
+            export_batch_sizes.append(len(results))
+            await super().export_batch(results, context)
+
+    exporter = BatchingExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=BatchingExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    await orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(5)])
+
+    assert batch_sizes == [2, 2, 1]
+    assert export_batch_sizes == [2, 2, 1]
+    exported_ids = {doc.id for doc, _ in exporter.export_calls}
+    assert exported_ids == {f"doc-{i}" for i in range(5)}
+
+
+@pytest.mark.asyncio
+async def test_run_exports_without_blocking_extraction() -> None:
+    """Keep extracting while an earlier export is still in progress."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(max_concurrency=2),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    all_extracted = asyncio.Event()
+
+    class CountingExtractor(DummyExtractor):
+        async def extract(
+            self,
+            document: Document,
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> ExtractionResult[DummySchema]:
+            result = await super().extract(document, schema, _context)
+            if len(self.extract_calls) == 2:
+                all_extracted.set()
+            return result
+
+    class SlowExporter(DummyExporter):
+        async def export(
+            self,
+            document: Document,
+            data: ExtractionResult[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> None:
+            await all_extracted.wait()
+            await super().export(document, data, _context)
+
+    exporter = SlowExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=CountingExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    await asyncio.wait_for(
+        orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(2)]),
+        timeout=5,
+    )
+
+    assert {doc.id for doc, _ in exporter.export_calls} == {"doc-0", "doc-1"}
+
+
+@pytest.mark.asyncio
+async def test_run_reads_on_separate_io_pool() -> None:
+    """Read on the I/O pool and convert on the worker pool."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_workers=1, io_max_workers=2
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    thread_names: dict[str, set[str]] = {"read": set(), "convert": set()}
+
+    class ThreadRecordingReader(DummyReader):
+        def read(
+            self,
+            path_identifier: PathIdentifier,
+            _context: PipelineContext | None = None,
+        ) -> DocumentBytes:
+            thread_names["read"].add(threading.current_thread().name)
+            return super().read(path_identifier, _context)
+
+    class ThreadRecordingConverter(DummyConverter):
+        def convert(
+            self,
+            document_bytes: DocumentBytes,
+            _context: PipelineContext | None = None,
+        ) -> Document:
+            thread_names["convert"].add(threading.current_thread().name)
+            return super().convert(document_bytes, _context)
+
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=ThreadRecordingReader(pipeline_config),
+        converter=ThreadRecordingConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    async with orchestrator:
+        await orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(4)])
+
+    assert len(exporter.export_calls) == 4
+    assert all(
+        name.startswith("extraction-orchestrator-io") for name in thread_names["read"]
+    )
+    assert all(
+        not name.startswith("extraction-orchestrator-io")
+        for name in thread_names["convert"]
+    )
+    assert orchestrator._io_pool is None
+
+
+@pytest.mark.asyncio
+async def test_run_skips_batches_with_mismatched_results() -> None:
+    """Log and skip a batch whose extractor returns the wrong number of results."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_concurrency=1, extraction_batch_size=2, extraction_batch_delay=1.0
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+
+    class ShortBatchExtractor(DummyExtractor):
+        async def extract_batch(
+            self,
+            documents: list[Document],
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> list[ExtractionResult[DummySchema]]:
+            results = await super().extract_batch(documents, schema, _context)
+            return results[:1]
+
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=ShortBatchExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    await orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(5)])
+
+    assert [doc.id for doc, _ in exporter.export_calls] == ["doc-4"]
+
+
+@pytest.mark.asyncio
+async def test_run_limits_extractor_and_exporter_calls_together() -> None:
+    """Keep extractor and exporter calls within max_concurrency in total."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(max_concurrency=2),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    in_flight = 0
+    peak = 0
+
+    async def track() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    class SlowExtractor(DummyExtractor):
+        async def extract(
+            self,
+            document: Document,
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> ExtractionResult[DummySchema]:
+            await track()
+            return await super().extract(document, schema, _context)
+
+    class SlowExporter(DummyExporter):
+        async def export(
+            self,
+            document: Document,
+            data: ExtractionResult[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> None:
+            await track()
+            await super().export(document, data, _context)
+
+    exporter = SlowExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=SlowExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    await orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(8)])
+
+    assert peak == 2
+    assert len(exporter.export_calls) == 8
+
+
+@pytest.mark.asyncio
+async def test_run_batched_exports_fail_per_document(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Only log the failing document when export_batch is not overridden."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_concurrency=1, extraction_batch_size=2, extraction_batch_delay=1.0
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+
+    class FailingExporter(DummyExporter):
+        async def export(
+            self,
+            document: Document,
+            data: ExtractionResult[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> None:
+            if document.id == "doc-0":
+                raise RuntimeError("boom")
+            await super().export(document, data, _context)
+
+    exporter = FailingExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    with caplog.at_level(logging.ERROR):
+        await orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(4)])
+
+    exported_ids = {doc.id for doc, _ in exporter.export_calls}
+    assert exported_ids == {"doc-1", "doc-2", "doc-3"}
+    failures = [
+        record for record in caplog.records if "pipeline failed" in record.message
+    ]
+    assert len(failures) == 1
+    assert "doc-0" in failures[0].getMessage()
+
+
+@pytest.mark.asyncio
+async def test_run_batches_extract_per_document_without_override() -> None:
+    """Extract each document of a batch on its own within max_concurrency."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            max_concurrency=1, extraction_batch_size=4, extraction_batch_delay=1.0
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    in_flight = 0
+    peak = 0
+
+    class TrackingExtractor(DummyExtractor):
+        async def extract(
+            self,
+            document: Document,
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> ExtractionResult[DummySchema]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                return await super().extract(document, schema, _context)
+            finally:
+                in_flight -= 1
+
+    exporter = DummyExporter(pipeline_config)
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=TrackingExtractor(pipeline_config, fail_on="doc-1"),
+        extraction_exporter=exporter,
+        schema=DummySchema,
+    )
+
+    await orchestrator.run([PathIdentifier(path=f"doc-{i}") for i in range(4)])
+
+    assert peak == 1
+    exported_ids = {doc.id for doc, _ in exporter.export_calls}
+    assert exported_ids == {"doc-0", "doc-2", "doc-3"}
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_default_cancels_remaining_on_failure() -> None:
+    """Cancel the other extractions in a batch when one fails."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    cancelled: list[str] = []
+
+    class SlowExtractor(DummyExtractor):
+        async def extract(
+            self,
+            document: Document,
+            schema: type[DummySchema],
+            _context: PipelineContext | None = None,
+        ) -> ExtractionResult[DummySchema]:
+            if document.id != "doc-1":
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.append(document.id)
+                    raise
+            return await super().extract(document, schema, _context)
+
+    extractor = SlowExtractor(pipeline_config, fail_on="doc-1")
+    converter = DummyConverter(pipeline_config)
+    documents = [
+        converter.convert(
+            DocumentBytes(file_bytes=b"data", path_identifier=PathIdentifier(path=p))
+        )
+        for p in ("doc-0", "doc-1", "doc-2")
+    ]
+
+    with pytest.raises(ExceptionGroup):
+        await extractor.extract_batch(documents, DummySchema)
+
+    assert sorted(cancelled) == ["doc-0", "doc-2"]
+
+
+@pytest.mark.asyncio
+async def test_collect_batch_takes_queued_documents_without_delay() -> None:
+    """Fill a batch from already queued documents when the delay is zero."""
+    pipeline_config = ExtractionPipelineConfig(
+        extraction_orchestrator=ExtractionOrchestratorConfig(
+            extraction_batch_size=2, extraction_batch_delay=0
+        ),
+        file_lister=BaseFileListerConfig(),
+        reader=BaseReaderConfig(),
+        converter=BaseConverterConfig(),
+        extractor=BaseExtractorConfig(),
+        extraction_exporter=BaseExtractionExporterConfig(),
+    )
+    orchestrator = ExtractionOrchestrator(
+        config=pipeline_config.extraction_orchestrator,
+        file_lister=DummyFileLister(pipeline_config),
+        reader=DummyReader(pipeline_config),
+        converter=DummyConverter(pipeline_config),
+        extractor=DummyExtractor(pipeline_config),
+        extraction_exporter=DummyExporter(pipeline_config),
+        schema=DummySchema,
+    )
+    converter = DummyConverter(pipeline_config)
+    document_queue: asyncio.Queue[Document | None] = asyncio.Queue()
+    for path in ("doc-0", "doc-1", "doc-2"):
+        document_queue.put_nowait(
+            converter.convert(
+                DocumentBytes(
+                    file_bytes=b"data", path_identifier=PathIdentifier(path=path)
+                )
+            )
+        )
+    document_queue.put_nowait(None)
+
+    first, first_done = await orchestrator._collect_batch(document_queue, 2)
+    second, second_done = await orchestrator._collect_batch(document_queue, 2)
+
+    assert [doc.id for doc in first] == ["doc-0", "doc-1"]
+    assert not first_done
+    assert [doc.id for doc in second] == ["doc-2"]
+    assert second_done
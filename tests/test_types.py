@@ -0,0 +1,15 @@
+"""Tests for the shared data models."""
+
+from document_extraction_tools.types import DocumentBytes, PathIdentifier
+
+
+def test_document_bytes_json_round_trip() -> None:
+    """Serialize binary file content to JSON and back."""
+    document_bytes = DocumentBytes(
+        file_bytes=b"%PDF-\xff\x00\xfe",
+        path_identifier=PathIdentifier(path="doc.pdf"),
+    )
+
+    restored = DocumentBytes.model_validate_json(document_bytes.model_dump_json())
+
+    assert restored == document_bytes